@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import copy
+import itertools
+import operator
 import random
 
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from array import array
+from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # We only need to import these for type checking purposes as we only use it
@@ -15,12 +17,19 @@ if TYPE_CHECKING:
 
 from Colors import Colors
 from Config import Config
-from Entity import Entity
+from Entity import Entity, SNAKE_DY, SNAKE_DX
 from EntityType import EntityType
-from Entities import Entities
-from WindowConfig import WindowConfig
+from ProjectilePool import ProjectilePool
+from WindowConfig import WindowConfig, TRUE_Y_OFFSET, TRUE_X_OFFSET
 from Logger import Logger
 from Borders import Borders
+from BoardArrays import BoardArrays
+
+# The (exclusive) true coord bounds entities may be placed within. These never change after
+# WindowConfig is loaded and are hit on every position update, so they're plain module
+# constants rather than WindowConfig lookups.
+MAX_TRUE_Y: int = WindowConfig.TRUE_BOARD_HEIGHT - 1
+MAX_TRUE_X: int = WindowConfig.TRUE_BOARD_WIDTH - 1
 
 
 class Board:
@@ -31,14 +40,24 @@ class Board:
     As such all coordinates assume game coordinates and NOT the "true" coordinates
     that curses use in functions like stdscr.getch()
 
-    Translation from game coords to "true" coords is handled with WindowConfig.convertToTrueY() and *TrueX()
+    Translation from game coords to "true" coords is done by adding the TRUE_Y_OFFSET/TRUE_X_OFFSET
+    module constants from WindowConfig
     """
 
-    curr_board: List[List[List[Entity]]]
-    next_board: List[List[List[Entity]]]
-    empty_board: List[List[List[Entity]]]
+    curr_board: BoardArrays
+    next_board: BoardArrays
+    empty_board: BoardArrays
+
+    # Keyed by Entity id. Dicts keep insertion order so iteration order matches spawn order.
+    instances: Dict[EntityType, Dict[int, Entity]]
+
+    # Entity ids stored in BoardArrays.occupants -> the Entity itself
+    entity_table: Dict[int, Entity]
+
+    projectile_pool: ProjectilePool
 
-    instances: Dict[EntityType, List[Entity]] = {}
+    # (symbols, colors) of each row as of the last drawBoard() to stdscr. None means "redraw"
+    drawn_rows: List[Optional[Tuple[array[int], array[int]]]]
 
     def __init__(
         self,
@@ -47,44 +66,61 @@ class Board:
         num_enemies: int,
         space_invaders: "SpaceInvaders",
     ) -> None:
+        # Per instance, a class level dict would be shared by every Board
+        self.instances = {}
         for entity_type in EntityType:
-            Logger.info(str(entity_type))
-            self.instances[entity_type] = []
+            Logger.info("%s", entity_type)
+            self.instances[entity_type] = {}
+        self.entity_table = {}
+        self.projectile_pool = ProjectilePool(Config.MAX_PROJECTILES)
 
         self.__initializeBoard()
         self.__populateBoard(player, enemies, num_enemies)
         self.space_invaders = space_invaders
 
+        self.invalidateDrawnRows()
+
     def finalizePosUpdates(self) -> None:
         self.clearCollisions()
-        self.curr_board = copy.deepcopy(self.next_board)
-        self.next_board = copy.deepcopy(self.empty_board)
+        self.curr_board, self.next_board = self.next_board, self.curr_board
+        self.next_board.resetFrom(self.empty_board)
 
     def clearCollisions(self) -> None:
-        for y, row_data in enumerate(self.getBoard(get_next_board=True)):
-            for x, entities in enumerate(row_data):
-                if len(entities) < 2:
-                    continue
-                elif len(entities) > 2:
-                    Logger.info(f"{entities}")
-                    raise Exception(
-                        "Should not ever have more than two entities on one position!"
-                    )
-
-                Logger.info(f"Detected collision at: (true_y:{y}, true_x:{x})")
-                Logger.info(f"{entities}")
-                for ent in entities:
-                    if ent.entity_type == EntityType.ENEMY:
-                        self.incrementScore()
-                    Logger.info(f"{ent}")
-                    self.clearPosAndEntity(ent)
-
-    def clearPosAndEntity(self, ent: Entity) -> None:
-        Logger.info(f"Clearing: {ent}")
-
-        y, x = ent.position
-        self.setEntityAtPos(y, x, None)
-        self.deleteEntityReferences(ent)
+        """
+        Only cells where a second entity was written this tick end up in
+        BoardArrays.collisions, so this never has to scan the whole grid.
+        """
+        board = self.getBoard(get_next_board=True)
+        if not board.collisions:
+            return
+
+        collided_idxs: Set[int] = set()
+        destroyed: List[Entity] = []
+
+        for idx, entity in board.collisions:
+            y, x = divmod(idx, board.width)
+            entities = [self.entity_table[board.occupants[idx]], entity]
+            if idx in collided_idxs:
+                Logger.info("%s", entities)
+                raise Exception(
+                    "Should not ever have more than two entities on one position!"
+                )
+            collided_idxs.add(idx)
+
+            if Logger.info_enabled:
+                Logger.info("Detected collision at: (true_y:%s, true_x:%s)", y, x)
+                Logger.info("%s", entities)
+            for ent in entities:
+                if ent.entity_type is EntityType.ENEMY:
+                    self.incrementScore()
+                if Logger.info_enabled:
+                    Logger.info("Clearing: %s", ent)
+                ent_y, ent_x = ent.position
+                self.setEntityAtPos(ent_y, ent_x, None)
+                destroyed.append(ent)
+
+        board.collisions.clear()
+        self.deleteBufferedDestroys(destroyed)
 
     def incrementScore(self) -> None:
         self.space_invaders.incrementScore()
@@ -93,45 +129,41 @@ class Board:
         """
         Initialize the board with empty cells and draw border
         """
-        empty_board: List[List[List[Entity]]] = [
-            [[] for _ in range(WindowConfig.TRUE_BOARD_WIDTH)]
-            for _ in range(WindowConfig.TRUE_BOARD_HEIGHT)
-        ]
-
         assert WindowConfig.BORDER_WIDTH == 1  # Pls no multi-width borders...
 
-        rows_to_draw: List[int] = WindowConfig.getRowsToDrawHorizontals()
+        empty_board = BoardArrays(
+            WindowConfig.TRUE_BOARD_HEIGHT, WindowConfig.TRUE_BOARD_WIDTH
+        )
 
-        # Non-corner Vertical borders
-        right_border_x = WindowConfig.TRUE_BOARD_WIDTH - 1
-        for y in range(1, WindowConfig.TRUE_BOARD_HEIGHT - 1):
-            if (
-                y in rows_to_draw[1:-1]
-            ):  # Bounds check? 0th and last rows use corner chars - not intersections
-                # Draw an intersection
-                empty_board[y][0].append(Borders.INTERSECT_LEFT)
-                empty_board[y][right_border_x].append(Borders.INTERSECT_RIGHT)
-            else:
-                # Draw a vertical line
-                empty_board[y][0].append(Borders.VERTICAL)
-                empty_board[y][right_border_x].append(Borders.VERTICAL)
+        rows_to_draw: Tuple[int, ...] = WindowConfig.getRowsToDrawHorizontals()
 
-        # Non-corner Horizontal borders
-        for x in range(1, WindowConfig.TRUE_BOARD_WIDTH - 1):
-            for y in rows_to_draw:
-                empty_board[y][x].append(Borders.HORIZONTAL)
+        # Vertical borders. Corners and intersections get overwritten below.
+        right_border_x = WindowConfig.TRUE_BOARD_WIDTH - 1
+        empty_board.fillColumn(0, Borders.VERTICAL)
+        empty_board.fillColumn(right_border_x, Borders.VERTICAL)
+
+        # Horizontal borders, with intersections where they meet the verticals.
+        # 0th and last rows use corner chars - not intersections
+        intersect_rows = frozenset(rows_to_draw[1:-1])
+        for y in rows_to_draw:
+            empty_board.fillRow(y, Borders.HORIZONTAL)
+            if y in intersect_rows:
+                empty_board.setCell(y, 0, Borders.INTERSECT_LEFT)
+                empty_board.setCell(y, right_border_x, Borders.INTERSECT_RIGHT)
 
         # Corners
         max_x = WindowConfig.TRUE_BOARD_WIDTH - 1
         max_y = WindowConfig.TRUE_BOARD_HEIGHT - 1
-        empty_board[0][0].append(Borders.TOP_LEFT)
-        empty_board[0][max_x].append(Borders.TOP_RIGHT)
-        empty_board[max_y][0].append(Borders.BOT_LEFT)
-        empty_board[max_y][max_x].append(Borders.BOT_RIGHT)
+        empty_board.setCell(0, 0, Borders.TOP_LEFT)
+        empty_board.setCell(0, max_x, Borders.TOP_RIGHT)
+        empty_board.setCell(max_y, 0, Borders.BOT_LEFT)
+        empty_board.setCell(max_y, max_x, Borders.BOT_RIGHT)
 
+        # empty_board is only ever read from after this point. It is the template
+        # that next_board's dirty cells get reset back to every tick.
         self.empty_board = empty_board
-        self.curr_board = copy.deepcopy(self.empty_board)
-        self.next_board = copy.deepcopy(self.empty_board)
+        self.curr_board = empty_board.copy()
+        self.next_board = empty_board.copy()
 
     def __populateBoard(
         self, player: Entity, enemies: List[Entity], num_enemies: int
@@ -150,10 +182,7 @@ class Board:
 
         enemy_y, enemy_x = 0, 0
         for i in range(num_enemies):
-            enemy = copy.deepcopy(
-                random.choice(enemies)
-            )  # Deep copy to ensure no shared refs
-            enemy.reInitializeId()
+            enemy = random.choice(enemies).clone()
 
             self.setEntityAtPos(enemy_y, enemy_x, enemy, use_curr_board=True)
 
@@ -161,7 +190,7 @@ class Board:
             enemy_y += dy
             enemy_x += dx
 
-            self.instances[EntityType.ENEMY].append(enemy)
+            self.instances[EntityType.ENEMY][enemy._id] = enemy
 
         Logger.info("===== Done populating initial entity positions.")
 
@@ -175,7 +204,7 @@ class Board:
         entity_y, entity_x = entity_pos
         proj_y, proj_x = entity_y + offset_y, entity_x + offset_x
 
-        projectile = Entities.genNewPlayerProjectile()
+        projectile = self.projectile_pool.acquire(is_player_projectile)
         self.setEntityAtPos(proj_y, proj_x, projectile)
 
         entity_type = (
@@ -183,12 +212,15 @@ class Board:
             if is_player_projectile
             else EntityType.ENEMY_PROJECTILE
         )
-        self.instances[entity_type].append(projectile)
-        Logger.info(
-            f"Spawning projectile: {projectile} - is_player: {is_player_projectile}"
-        )
+        self.instances[entity_type][projectile._id] = projectile
+        if Logger.info_enabled:
+            Logger.info(
+                "Spawning projectile: %s - is_player: %s",
+                projectile,
+                is_player_projectile,
+            )
 
-    def getBoard(self, get_next_board=False) -> List[List[List[Entity]]]:
+    def getBoard(self, get_next_board=False) -> BoardArrays:
         return self.next_board if get_next_board else self.curr_board
 
     def drawBoard(
@@ -196,33 +228,63 @@ class Board:
         stdscr: Optional[curses.window] = None,  # type: ignore
         return_as_str: bool = False,
     ) -> Optional[str]:
-        return_str: Optional[str] = None
+        board = self.getBoard()
+        if board.collisions:
+            raise Exception(
+                "Got to draw step without clearing out multi-entity cells. Should have been cleared by collision handlers"
+            )
 
-        for y, row_data in enumerate(self.getBoard()):
-            for x, entities in enumerate(row_data):
-                if len(entities) > 1:
-                    raise Exception(
-                        "Got to draw step without clearing out multi-entity cells. Should have been cleared by collision handlers"
-                    )
-                entity = entities[0] if len(entities) == 1 else None
-                if entity is not None:
-                    if return_as_str:
-                        if return_str is None:
-                            return_str = ""
-                        return_str += entity.symbol
-                    elif stdscr is not None:  # Redundant but type checking purposes
-                        stdscr.addch(y, x, entity.symbol, Colors.getAttr(entity.color))
-                else:
-                    if return_as_str:
-                        if return_str is None:
-                            return_str = ""
-                        return_str += " "
-                    elif stdscr is not None:
-                        stdscr.addch(y, x, " ")
-            if return_str is not None:
-                return_str += "\n"
-
-        return return_str
+        rows: List[str] = []
+        symbols = board.symbols
+        colors = board.colors
+        width = board.width
+        attr_table = Colors.attr_table  # NO_COLOR indexes to the default attr
+        drawn_rows = self.drawn_rows
+        addstr = stdscr.addstr if stdscr is not None else None
+
+        for y in range(board.height):
+            if return_as_str:
+                rows.append(board.getRowStr(y))
+            elif addstr is not None:  # Redundant but type checking purposes
+                # Rows that look the same as what's already on screen are skipped
+                row_start = y * width
+                row_end = row_start + width
+                row_symbols = symbols[row_start:row_end]
+                row_colors = colors[row_start:row_end]
+                prev = drawn_rows[y]
+                drawn = (row_symbols, row_colors)
+                if prev == drawn:
+                    continue
+                drawn_rows[y] = drawn
+
+                # Within the row, only cells that differ from what was drawn last are redrawn,
+                # with one addstr per run of changed, same colored cells.
+                # Without a previous frame every cell counts as changed.
+                old_cells = zip(*prev) if prev is not None else itertools.repeat(None)
+                is_changed = map(operator.ne, zip(row_symbols, row_colors), old_cells)
+
+                row = board.getRowStr(y)
+                run_x = 0
+                for (changed, color), run in itertools.groupby(
+                    zip(is_changed, row_colors)
+                ):
+                    run_len = sum(1 for _ in run)
+                    if changed:
+                        addstr(
+                            y, run_x, row[run_x : run_x + run_len], attr_table[color]
+                        )
+                    run_x += run_len
+
+        if return_as_str:
+            return "".join(f"{row}\n" for row in rows)
+        return None
+
+    def invalidateDrawnRows(self) -> None:
+        """
+        Forget what drawBoard() last drew so the next draw redraws every row. Needed
+        whenever something other than drawBoard() draws over the board area.
+        """
+        self.drawn_rows = [None] * WindowConfig.TRUE_BOARD_HEIGHT
 
     def logEntityAtPos(self, y: int, x: int) -> None:
         dMin = -2
@@ -257,20 +319,26 @@ Ent: {self.getEntityAtPos(y,x)}
 
         Logger.info(log)
 
+    """
+    The get*() instance accessors return a snapshot list so callers can safely
+    delete entities while iterating over them.
+    """
+
     def getAliveEnemies(self) -> List[Entity]:
-        return self.instances[EntityType.ENEMY]
+        return list(self.instances[EntityType.ENEMY].values())
+
+    def getAliveEnemyCount(self) -> int:
+        return len(self.instances[EntityType.ENEMY])
 
     def getPlayerProjectiles(self) -> List[Entity]:
-        return self.instances[EntityType.PLAYER_PROJECTILE]
+        return list(self.instances[EntityType.PLAYER_PROJECTILE].values())
 
     def getEnemyProjectiles(self) -> List[Entity]:
-        return self.instances[EntityType.ENEMY_PROJECTILE]
+        return list(self.instances[EntityType.ENEMY_PROJECTILE].values())
 
     def deleteEntity(self, entity: Entity) -> None:
-        instances = self.instances[entity.entity_type]
-        instances.pop(instances.index(entity))
-
         ent_y, ent_x = entity.position
+        self.deleteEntityReferences(entity)
         self.setEntityAtPos(ent_y, ent_x, None)
 
     def getEntityAtPos(self, y: int, x: int, use_next_board=False) -> Optional[Entity]:
@@ -278,19 +346,26 @@ Ent: {self.getEntityAtPos(y,x)}
         Assumes non-true board width/height
         """
 
-        true_y = WindowConfig.convertToTrueY(y)
-        true_x = WindowConfig.convertToTrueX(x)
+        true_y = y + TRUE_Y_OFFSET
+        true_x = x + TRUE_X_OFFSET
 
         board = self.next_board if use_next_board else self.curr_board
-        ents = board[true_y][true_x]
-        if len(ents) > 1:
+        idx = true_y * board.width + true_x
+        if any(collision_idx == idx for collision_idx, _ in board.collisions):
             raise Exception(
                 "Do we want exception here? Should collision handlers have run at this point?"
             )
-        return ents[0] if len(ents) == 1 else None
+        occupant = board.occupants[idx]
+        return self.entity_table.get(occupant)
 
     def isPosOccupied(self, y: int, x: int) -> bool:
-        return self.getEntityAtPos(y, x) != None
+        """
+        Assumes non-true board width/height. Reads the occupant grid directly rather than
+        resolving the Entity through getEntityAtPos().
+        """
+        board = self.curr_board
+        idx = (y + TRUE_Y_OFFSET) * board.width + (x + TRUE_X_OFFSET)
+        return board.occupants[idx] != BoardArrays.EMPTY
 
     def setEntityAtPos(
         self, y: int, x: int, entity: Optional[Entity], use_curr_board: bool = False
@@ -303,25 +378,15 @@ Ent: {self.getEntityAtPos(y,x)}
         ie ignoring the borders
         """
 
-        true_y = WindowConfig.convertToTrueY(y)
-        true_x = WindowConfig.convertToTrueX(x)
-
-        try:
-            assert (
-                true_x >= WindowConfig.convertToTrueX(0)
-                and true_x < WindowConfig.TRUE_BOARD_WIDTH - 1
-            )
-            assert (
-                true_y >= WindowConfig.convertToTrueY(0)
-                and true_y < WindowConfig.TRUE_BOARD_HEIGHT - 1
-            )
-        except:
+        true_y = y + TRUE_Y_OFFSET
+        true_x = x + TRUE_X_OFFSET
 
+        if not (
+            TRUE_X_OFFSET <= true_x < MAX_TRUE_X
+            and TRUE_Y_OFFSET <= true_y < MAX_TRUE_Y
+        ):
             if entity is not None:
-                Logger.info(
-                    "Entity was moved out of bounds - Deleting (by not placing on next_board)."
-                )
-                self.deleteEntityReferences(entity)
+                self.__deleteOutOfBounds(entity)
                 return
             else:
                 raise Exception(
@@ -329,18 +394,130 @@ Ent: {self.getEntityAtPos(y,x)}
                 )
 
         board = self.curr_board if use_curr_board else self.next_board
+        idx = true_y * board.width + true_x
         if entity is not None:
-            if entity in board[true_y][true_x]:
-                raise Exception(f"Setting position of entity already set? - {entity}")
-            board[true_y][true_x].append(entity)
+            self.__occupyCell(board, idx, entity)
             entity.setPosition(y, x)
         else:
-            board[true_y][true_x] = []
+            board.dirty_cells.add(idx)
+            board.symbols[idx] = self.empty_board.symbols[idx]
+            board.colors[idx] = self.empty_board.colors[idx]
+            board.occupants[idx] = BoardArrays.EMPTY
 
-        if use_curr_board:
-            self.curr_board = board
+    def __occupyCell(self, board: BoardArrays, idx: int, entity: Entity) -> None:
+        """
+        Write `entity` into cell `idx` of `board`, or record a collision if the cell is taken.
+        Does not bounds check or update the entity's position.
+        """
+        board.dirty_cells.add(idx)
+        occupant = board.occupants[idx]
+        if occupant == entity._id:
+            raise Exception(f"Setting position of entity already set? - {entity}")
+        elif occupant != BoardArrays.EMPTY:
+            board.collisions.append((idx, entity))
         else:
-            self.next_board = board
+            board.symbols[idx] = ord(entity.symbol)
+            board.colors[idx] = entity.color
+            board.occupants[idx] = entity._id
+        self.entity_table[entity._id] = entity
+
+    def moveEntities(self, entities: Iterable[Entity], dy: int, dx: int) -> None:
+        """
+        Batched move of every entity in `entities` by (dy, dx) onto next_board.
+
+        Same result as calling a move*() method on each entity, but the bounds and offsets
+        are bound to locals once and each entity costs a single method call instead of
+        going through Entity.__move() -> setEntityAtPos() -> Entity.setPosition().
+
+        Entities moved out of bounds are deleted, so this is meant for projectiles.
+        """
+        board = self.next_board
+        width = board.width
+        yoff, xoff = TRUE_Y_OFFSET, TRUE_X_OFFSET
+        max_ty, max_tx = MAX_TRUE_Y, MAX_TRUE_X
+        occupy_cell = self.__occupyCell
+
+        for entity in entities:
+            new_y = entity.pos_y + dy
+            new_x = entity.pos_x + dx
+            true_y, true_x = new_y + yoff, new_x + xoff
+
+            if not (xoff <= true_x < max_tx and yoff <= true_y < max_ty):
+                self.__deleteOutOfBounds(entity)
+                continue
+
+            occupy_cell(board, true_y * width + true_x, entity)
+            entity.pos_y = new_y
+            entity.pos_x = new_x
+
+    def moveEnemies(self, enemies: Iterable[Entity]) -> None:
+        """
+        Batched Entity.moveToNextPos() for every enemy in `enemies`.
+
+        Enemies only step once every Config.TICKS_PER_ENEMY_MOVEMENT ticks and otherwise stay
+        still, so most ticks this is just re-placing every enemy on next_board.
+
+        The step itself is Entity.genNextPosOffsetForNonProjectile() with depth=1 inlined as
+        a lookup into the precomputed snake path, so nothing in this loop calls back into Entity.
+        The snake path never leaves the board so there is no bounds check.
+        """
+        board = self.next_board
+        width = board.width
+        yoff, xoff = TRUE_Y_OFFSET, TRUE_X_OFFSET
+        game_width = Config.BOARD_WIDTH
+        snake_dy, snake_dx = SNAKE_DY, SNAKE_DX
+        ticks_per_move = Config.TICKS_PER_ENEMY_MOVEMENT
+        occupy_cell = self.__occupyCell
+
+        for enemy in enemies:
+            y = enemy.pos_y
+            x = enemy.pos_x
+            if enemy.ticks_since_last_move > ticks_per_move:
+                idx = y * game_width + x
+                dy = snake_dy[idx]
+                dx = snake_dx[idx]
+                if not (dy or dx):
+                    raise Exception(
+                        "genNextPos() determined moving down is impossible! (Game over?)"
+                    )
+                y += dy
+                x += dx
+                enemy.ticks_since_last_move = 0
+            enemy.ticks_since_last_move += 1
+
+            occupy_cell(board, (y + yoff) * width + (x + xoff), enemy)
+            enemy.pos_y = y
+            enemy.pos_x = x
+
+    def __deleteOutOfBounds(self, entity: Entity) -> None:
+        """
+        Projectiles that leave the board are deleted rather than placed on next_board.
+        """
+        if Logger.info_enabled:
+            Logger.info(
+                "Entity was moved out of bounds - Deleting (by not placing on next_board)."
+            )
+        self.deleteEntityReferences(entity)
 
     def deleteEntityReferences(self, entity: Entity) -> None:
-        self.instances[entity.entity_type].remove(entity)
+        """
+        Safe to call more than once for the same entity. A projectile is written to both its
+        spawn cell and the cell it moved to on the tick it's fired, so it can collide twice
+        in one tick. Only the call that actually removes it releases it back to the pool,
+        releasing it twice would hand the same Entity out to two shots.
+        """
+        removed = self.instances[entity.entity_type].pop(entity._id, None)
+        self.entity_table.pop(entity._id, None)
+        if removed is not None:
+            self.__releaseIfProjectile(entity)
+
+    def deleteBufferedDestroys(self, entities: List[Entity]) -> None:
+        for entity in entities:
+            self.deleteEntityReferences(entity)
+
+    def __releaseIfProjectile(self, entity: Entity) -> None:
+        if entity.entity_type in (
+            EntityType.PLAYER_PROJECTILE,
+            EntityType.ENEMY_PROJECTILE,
+        ):
+            self.projectile_pool.release(entity)
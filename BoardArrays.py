@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from array import array
+
+from typing import List, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from Borders import Border
+    from Entity import Entity
+
+
+class BoardArrays:
+    """
+    Struct-of-arrays storage for a single board grid.
+
+    Instead of a list-of-lists of Entity objects, every cell is described by three
+    parallel flat arrays indexed by `true_y * width + true_x`:
+        - symbols:   Unicode codepoint drawn in the cell
+        - colors:    Colors id of the cell. 0 means "no color" (ie, empty space)
+        - occupants: Entity id of whatever is in the cell. 0 means nothing is there.
+                     Borders are drawn but are _not_ occupants.
+
+    symbols/occupants are 32 bit ("I") and colors are 8 bit ("B"), so a cell costs 9 bytes
+    across the three arrays rather than a pointer to a per-cell list of Entity objects.
+
+    A cell can only hold a single occupant, so when a second entity lands on an already
+    occupied cell it is recorded in `collisions` as (idx, entity) for the collision handlers.
+
+    Every cell written through Board.setEntityAtPos() is recorded in `dirty_cells` so that
+    resetting the grid back to the empty template only has to touch those cells.
+
+    All coordinates here are "true" coordinates, not game coordinates.
+    """
+
+    SPACE: int = ord(" ")
+    NO_COLOR: int = 0
+    EMPTY: int = 0
+
+    height: int
+    width: int
+
+    symbols: array[int]
+    colors: array[int]
+    occupants: array[int]
+
+    collisions: List[Tuple[int, Entity]]
+    dirty_cells: Set[int]
+
+    def __init__(self, height: int, width: int) -> None:
+        self.height = height
+        self.width = width
+
+        size = height * width
+        self.symbols = array("I", [self.SPACE]) * size
+        self.colors = array("B", [self.NO_COLOR]) * size
+        self.occupants = array("I", [self.EMPTY]) * size
+
+        self.collisions = []
+        self.dirty_cells = set()
+
+    def index(self, true_y: int, true_x: int) -> int:
+        return true_y * self.width + true_x
+
+    def copy(self) -> BoardArrays:
+        """
+        New BoardArrays with the same cells. Slicing an array copies its buffer directly
+        so nothing is allocated only to be overwritten.
+        """
+        clone = BoardArrays.__new__(BoardArrays)
+        clone.height = self.height
+        clone.width = self.width
+        clone.symbols = self.symbols[:]
+        clone.colors = self.colors[:]
+        clone.occupants = self.occupants[:]
+        clone.collisions = list(self.collisions)
+        clone.dirty_cells = set(self.dirty_cells)
+        return clone
+
+    def resetFrom(self, template: BoardArrays) -> None:
+        """
+        Restore the cells dirtied since the last reset back to `template`, which
+        is O(entities) instead of copying the whole grid.
+        """
+        for idx in self.dirty_cells:
+            self.symbols[idx] = template.symbols[idx]
+            self.colors[idx] = template.colors[idx]
+            self.occupants[idx] = template.occupants[idx]
+        self.collisions.clear()
+        self.dirty_cells.clear()
+
+    def setCell(self, true_y: int, true_x: int, border: Border) -> None:
+        idx = self.index(true_y, true_x)
+        self.symbols[idx] = border.symbol
+        self.colors[idx] = border.color
+
+    def fillRow(self, true_y: int, border: Border) -> None:
+        symbol, color = border
+        start = self.index(true_y, 0)
+        self.symbols[start : start + self.width] = array("I", [symbol]) * self.width
+        self.colors[start : start + self.width] = array("B", [color]) * self.width
+
+    def fillColumn(self, true_x: int, border: Border) -> None:
+        symbol, color = border
+        self.symbols[true_x :: self.width] = array("I", [symbol]) * self.height
+        self.colors[true_x :: self.width] = array("B", [color]) * self.height
+
+    def getRowStr(self, true_y: int) -> str:
+        start = self.index(true_y, 0)
+        return "".join(map(chr, self.symbols[start : start + self.width]))
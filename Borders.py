@@ -1,16 +1,26 @@
 #!/usr/bin/env python3
 
 from Colors import Colors
-from Entity import Entity
-from EntityType import EntityType
+
+from typing import NamedTuple
+
+
+class Border(NamedTuple):
+    symbol: int  # Unicode codepoint, as stored in BoardArrays.symbols
+    color: int
 
 
 class Borders:
-    VERTICAL = Entity("║", Colors.WHITE, EntityType.BORDER)
-    HORIZONTAL = Entity("═", Colors.WHITE, EntityType.BORDER)
-    TOP_LEFT = Entity("╔", Colors.WHITE, EntityType.BORDER)
-    TOP_RIGHT = Entity("╗", Colors.WHITE, EntityType.BORDER)
-    BOT_LEFT = Entity("╚", Colors.WHITE, EntityType.BORDER)
-    BOT_RIGHT = Entity("╝", Colors.WHITE, EntityType.BORDER)
-    INTERSECT_LEFT = Entity("╠", Colors.WHITE, EntityType.BORDER)
-    INTERSECT_RIGHT = Entity("╣", Colors.WHITE, EntityType.BORDER)
+    """
+    Borders never move or collide so they are lightweight Border tuples which get
+    written straight into BoardArrays rather than full Entity objects.
+    """
+
+    VERTICAL: Border = Border(ord("║"), Colors.WHITE)
+    HORIZONTAL: Border = Border(ord("═"), Colors.WHITE)
+    TOP_LEFT: Border = Border(ord("╔"), Colors.WHITE)
+    TOP_RIGHT: Border = Border(ord("╗"), Colors.WHITE)
+    BOT_LEFT: Border = Border(ord("╚"), Colors.WHITE)
+    BOT_RIGHT: Border = Border(ord("╝"), Colors.WHITE)
+    INTERSECT_LEFT: Border = Border(ord("╠"), Colors.WHITE)
+    INTERSECT_RIGHT: Border = Border(ord("╣"), Colors.WHITE)
@@ -2,7 +2,7 @@
 
 import curses
 
-from typing import Dict
+from typing import Dict, Tuple
 
 
 class Colors:
@@ -26,27 +26,36 @@ class Colors:
         int, int
     ] = {}  # The value 'int' is a curses attribute which is an int bitmask
 
-    def __init__(self) -> None:
-        curses.init_pair(self.RED, curses.COLOR_RED, curses.COLOR_BLACK)
-        Colors.mapping[self.RED] = curses.color_pair(self.RED)
-
-        curses.init_pair(self.GREEN, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        Colors.mapping[self.GREEN] = curses.color_pair(self.GREEN)
-
-        curses.init_pair(self.YELLOW, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        Colors.mapping[self.YELLOW] = curses.color_pair(self.YELLOW)
+    # Same attrs as `mapping` but as a flat tuple indexed by color id for hot draw loops.
+    # Index 0 is "no color" and maps to the default attribute.
+    attr_table: Tuple[int, ...] = ()
 
-        curses.init_pair(self.CYAN, curses.COLOR_CYAN, curses.COLOR_BLACK)
-        Colors.mapping[self.CYAN] = curses.color_pair(self.CYAN)
-
-        curses.init_pair(self.MAGENTA, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
-        Colors.mapping[self.MAGENTA] = curses.color_pair(self.MAGENTA)
-
-        curses.init_pair(self.WHITE, curses.COLOR_WHITE, curses.COLOR_BLACK)
-        Colors.mapping[self.WHITE] = curses.color_pair(self.WHITE)
+    def __init__(self) -> None:
+        """
+        Only does the curses calls the first time. The pairs and attrs don't change
+        afterwards so later Colors() calls are no-ops.
+        """
+        if Colors.mapping:
+            return
+
+        for color_id, curses_color in (
+            (self.RED, curses.COLOR_RED),
+            (self.GREEN, curses.COLOR_GREEN),
+            (self.YELLOW, curses.COLOR_YELLOW),
+            (self.CYAN, curses.COLOR_CYAN),
+            (self.MAGENTA, curses.COLOR_MAGENTA),
+            (self.WHITE, curses.COLOR_WHITE),
+        ):
+            curses.init_pair(color_id, curses_color, curses.COLOR_BLACK)
+            Colors.mapping[color_id] = curses.color_pair(color_id)
+
+        Colors.attr_table = tuple(
+            Colors.mapping.get(color_id, 0)
+            for color_id in range(max(Colors.mapping) + 1)
+        )
 
     @staticmethod
     def getAttr(color_id: int) -> int:
-        if color_id not in Colors.mapping:
+        if not 0 < color_id < len(Colors.attr_table):
             raise Exception(f"Got a color ID that we haven't mapped! Got: {color_id}")
-        return Colors.mapping[color_id]
+        return Colors.attr_table[color_id]
@@ -4,6 +4,8 @@
 # Configs #
 ###########
 
+import logging
+
 from Colors import Colors
 
 from typing import List
@@ -19,8 +21,10 @@ class Config:
     TICKS_PER_ENEMY_MOVEMENT: int = 3
 
     LOG_PATH: str = "it.was.aliens.log"
+    LOG_LEVEL: int = logging.WARNING  # logging.DEBUG to log every tick
 
     TICKS_PER_SHOT: int = 1
+    MAX_PROJECTILES: int = BOARD_HEIGHT * 4  # Projectiles preallocated by ProjectilePool
 
     # PLAYER_SYMBOL: str = "♕"
     PLAYER_SYMBOL: str = "ﾑ"
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import time
-import uuid
+import itertools
+from array import array
 from typing import Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,35 +15,100 @@ if TYPE_CHECKING:
 
 from Config import Config
 from Colors import Colors
-from WindowConfig import WindowConfig
 from EntityType import EntityType
 from Logger import Logger
 
+# Config never changes at runtime so bind the values used every tick once here
+_TICKS_MOVE: int = Config.TICKS_PER_ENEMY_MOVEMENT
+_TICKS_SHOT: int = Config.TICKS_PER_SHOT
+_BW: int = Config.BOARD_WIDTH
+_BW1: int = Config.BOARD_WIDTH - 1
+_BH1: int = Config.BOARD_HEIGHT - 1
+# pos_y/pos_x of an Entity that hasn't been placed yet. Board never stores an out of bounds
+# position, so a placed Entity's coords are never negative.
+_NO_POS: int = -1
+
+
+def buildSnakePath() -> Tuple[array[int], array[int]]:
+    """
+    The enemy snake path only depends on the cell an enemy is in, so the next step from
+    every game cell is computed once here. Both arrays are indexed by `y * BOARD_WIDTH + x`.
+
+    Left if odd row, Right if even row, and down a row when the edge is reached.
+    The last cell of the path can't move at all and is (0, 0).
+    """
+    dys = array("b")
+    dxs = array("b")
+    for y in range(Config.BOARD_HEIGHT):
+        dx = -1 if y & 1 else +1
+        for x in range(Config.BOARD_WIDTH):
+            if 0 <= x + dx <= _BW1:
+                dys.append(0)
+                dxs.append(dx)
+            elif y < _BH1:
+                dys.append(+1)
+                dxs.append(0)
+            else:
+                dys.append(0)
+                dxs.append(0)
+    return dys, dxs
+
+
+SNAKE_DY, SNAKE_DX = buildSnakePath()
+
 
 class Entity:
     """
-    With the exception of text drawn on the screen, all other
-    elements that are drawn on the screen including borders, player, enemies, projectiles, etc
+    With the exception of text drawn on the screen and the borders, all other
+    elements that are drawn on the screen including player, enemies, projectiles, etc
     are all "Entities".
 
     This class handles state and movement/updates for any and all entities.
 
-    Border entities do not have an initial position set with the understanding that border entities
-    should never be moved with a canMove*() or move*() method call.
+    Entity ids are small ints handed out sequentially so that they can be stored in
+    BoardArrays.occupants. 0 is never handed out as it means "empty cell".
+
+    Every Entity is a distinct object (see clone()), so equality and hashing are left as
+    the default identity based ones.
     """
 
+    # No per-instance __dict__. Any new instance attribute needs to be added here too.
+    __slots__ = (
+        "symbol",
+        "color",
+        "entity_type",
+        "_id",
+        "pos_y",
+        "pos_x",
+        "ticks_since_last_move",
+        "ticks_since_last_shot",
+        "_is_player_proj",
+        "_is_enemy_proj",
+        "_is_projectile",
+        "_is_mover",
+        "_type_name",
+    )
+
     symbol: str
     color: int
     entity_type: EntityType
 
     _id: int
+    _id_counter = itertools.count(1)
 
-    sizes: WindowConfig
+    # Kept as two ints rather than a tuple so moving doesn't allocate. See the position property.
+    pos_y: int
+    pos_x: int
 
-    position: Tuple[int, int]  # y,x as per curses format
+    ticks_since_last_move: int
+    ticks_since_last_shot: int
 
-    ticks_since_last_move: int = 0
-    ticks_since_last_shot: int = 0
+    # Derived from entity_type by setEntityType() so hot paths can branch on a plain bool
+    _is_player_proj: bool
+    _is_enemy_proj: bool
+    _is_projectile: bool
+    _is_mover: bool  # Player or enemy, ie moves with genNextPosOffsetForNonProjectile()
+    _type_name: str  # entity_type.name, for __repr__()
 
     def __init__(
         self,
@@ -53,47 +118,86 @@ class Entity:
     ) -> None:
         self.symbol = symbol
         self.color = color
+        self.setEntityType(entity_type)
+        self._id = next(Entity._id_counter)
+        self.pos_y = self.pos_x = _NO_POS
+
+        self.ticks_since_last_move = 0
+        self.ticks_since_last_shot = 0
+
+    def setEntityType(self, entity_type: EntityType) -> None:
+        """
+        Always change entity_type through here so the cached type flags stay in sync.
+        """
         self.entity_type = entity_type
-        self._id = uuid.uuid4().int
+        self._is_player_proj = entity_type is EntityType.PLAYER_PROJECTILE
+        self._is_enemy_proj = entity_type is EntityType.ENEMY_PROJECTILE
+        self._is_projectile = self._is_player_proj or self._is_enemy_proj
+        self._is_mover = entity_type in (EntityType.PLAYER, EntityType.ENEMY)
+        self._type_name = entity_type.name
+
+    def clone(self) -> "Entity":
+        """
+        New Entity that looks like this one but has its own id and no position.
+        Much cheaper than copy.deepcopy() for stamping out entities from templates.
 
-    def reInitializeId(self) -> None:
-        self._id = uuid.uuid4().int
-        Logger.info(f"INITIALIZED NEW ENTITY: {self._id} - {self}")
+        Skips __init__ and copies the cached type flags over instead of recomputing them.
+        """
+        clone = Entity.__new__(Entity)
+        clone.symbol = self.symbol
+        clone.color = self.color
+        clone.entity_type = self.entity_type
+        clone._is_player_proj = self._is_player_proj
+        clone._is_enemy_proj = self._is_enemy_proj
+        clone._is_projectile = self._is_projectile
+        clone._is_mover = self._is_mover
+        clone._type_name = self._type_name
+        clone._id = next(Entity._id_counter)
+        clone.pos_y = clone.pos_x = _NO_POS
+        clone.ticks_since_last_move = 0
+        clone.ticks_since_last_shot = 0
+        return clone
 
     def __repr__(self) -> str:
-        try:
-            return f"{EntityType(self.entity_type).name}-{self.symbol}-{self.position}-{str(self._id)[:8]}"
-        except AttributeError:
-            return f"{EntityType(self.entity_type).name}-{self.symbol}-NoPos-{str(self._id)[:8]}"
+        pos = self.position if self.hasPosition() else "NoPos"
+        return f"{self._type_name}-{self.symbol}-{pos}-{str(self._id)[:8]}"
 
-    def __eq__(self, other) -> bool:
-        return self._id == other._id
+    def _log(self, msg: str, *args: object) -> None:
+        if Logger.debug_enabled:
+            Logger.debug("%s: " + msg, self, *args)
 
-    def __log(self, msg: str) -> None:
-        Logger.debug(f"{self}: {msg}")
+    @property
+    def position(self) -> Tuple[int, int]:
+        """
+        y,x as per curses format. Is (-1, -1) until a position has been set.
+        """
+        return (self.pos_y, self.pos_x)
+
+    def hasPosition(self) -> bool:
+        return self.pos_y >= 0
 
     def setPosition(self, y: int, x: int) -> None:
         """
         This function assumes BOARD_WIDTH/HEIGHT as the bounds and _not_ TRUE_BOARD_WIDTH/HEIGHT
         """
-        self.position = (y, x)
+        self.pos_y = y
+        self.pos_x = x
 
     def getPos(self) -> Tuple[int, int]:
-        try:
-            return self.position
-        except:
+        if not self.hasPosition():
             raise Exception(
                 "This Entity doesn't have a position set but getPos() was called!"
             )
+        return self.position
 
     def genNextPosOffset(
         self, curr_y: int, curr_x: int, depth: int = 1
     ) -> Tuple[int, int]:
-        if self.entity_type == EntityType.PLAYER_PROJECTILE:
+        if self._is_player_proj:
             return (-1, 0)
-        elif self.entity_type == EntityType.ENEMY_PROJECTILE:
+        elif self._is_enemy_proj:
             return (+1, 0)
-        elif self.entity_type in (EntityType.PLAYER, EntityType.ENEMY):
+        elif self._is_mover:
             return self.genNextPosOffsetForNonProjectile(curr_y, curr_x, depth)
         else:
             raise Exception(
@@ -111,64 +215,54 @@ class Entity:
         the offset for not just "next pos" but multiple positions ahead.
         """
 
-        dx = -1 if curr_y % 2 == 1 else +1  # Left if odd row, Right if even row
-        if dx == -1:
-            can_move_horizontal = self.canMoveLeft((curr_y, curr_x))
-        else:
-            can_move_horizontal = self.canMoveRight((curr_y, curr_x))
-
-        if not can_move_horizontal:
-            if not self.canMoveDown():
+        y, x = curr_y, curr_x
+        for _ in range(depth):
+            idx = y * _BW + x
+            dy = SNAKE_DY[idx]
+            dx = SNAKE_DX[idx]
+            if not (dy or dx):
                 raise Exception(
                     "genNextPos() determined moving down is impossible! (Game over?)"
                 )
-            offset = (+1, 0)
-        else:
-            offset = (0, dx)
+            y += dy
+            x += dx
 
-        if depth > 1:
-            offset_y, offset_x = offset
-            next_y, next_x = curr_y + offset_y, curr_x + offset_x
-            next_offset_y, next_offset_x = self.genNextPosOffset(
-                next_y, next_x, depth - 1
-            )
-
-            offset = (offset_y + next_offset_y, offset_x + next_offset_x)
-
-        return offset
+        return (y - curr_y, x - curr_x)
 
     def moveToNextPos(self, board: "Board") -> None:
         """
         Assumes this method is called on Entity every tick.
         """
-        if self.ticks_since_last_move > Config.TICKS_PER_ENEMY_MOVEMENT:
-            old_y, old_x = self.position
-            dy, dx = self.genNextPosOffset(old_y, old_x)
-            new_y, new_x = old_y + dy, old_x + dx
+        if self.ticks_since_last_move > _TICKS_MOVE:
+            dy, dx = self.genNextPosOffset(self.pos_y, self.pos_x)
 
-            self.__move(board, dy, dx)
+            self._move(board, dy, dx)
             self.ticks_since_last_move = 0
         else:
             self.stayStill(board)
 
         self.ticks_since_last_move += 1
 
-    def __isOutOfBounds(self, y: int, x: int) -> bool:
+    def _isOutOfBounds(
+        self,
+        y: int,
+        x: int,
+        _W: int = _BW1,
+        _H: int = _BH1,
+    ) -> bool:
         """
         Assumes non-true boardsize. Ie, Config.BOARD_WIDTH/HEIGHT instead of TRUE_BOARD_WIDTH/HEIGHT
-        """
 
-        # self.__log(
-        #    f"x:{x} < 0 or x:{x} > {Config.BOARD_WIDTH - 1} or y:{y} < 0 or y:{y} > {Config.BOARD_HEIGHT - 1}"
-        # )
+        If any of the four terms is negative then so is the OR of all of them, so this is a
+        single expression instead of four comparisons. The bounds are bound as default args
+        so they're local loads.
+        """
 
-        return (
-            x < 0 or x > Config.BOARD_WIDTH - 1 or y < 0 or y > Config.BOARD_HEIGHT - 1
-        )
+        return (x | y | (_W - x) | (_H - y)) < 0
 
     def spawnProjectile(self, board: "Board") -> None:
-        if self.ticks_since_last_shot > Config.TICKS_PER_SHOT:
-            is_player = self.entity_type == EntityType.PLAYER
+        if self.ticks_since_last_shot > _TICKS_SHOT:
+            is_player = self.entity_type is EntityType.PLAYER
 
             board.spawnProjectile(self.position, is_player)
             self.ticks_since_last_shot = 0
@@ -183,59 +277,71 @@ class Entity:
     """
 
     def canMoveLeft(self, custom_pos: Optional[Tuple[int, int]] = None) -> bool:
-        return self.__canMove(0, -1, custom_pos)
+        if custom_pos is None:
+            return self._canMoveSelf(0, -1)
+        return self._canMoveFrom(*custom_pos, 0, -1)
 
     def moveLeft(self, board: "Board"):
-        self.__move(board, 0, -1)
+        self._move(board, 0, -1)
 
     def canMoveRight(self, custom_pos: Optional[Tuple[int, int]] = None) -> bool:
-        return self.__canMove(0, +1, custom_pos)
+        if custom_pos is None:
+            return self._canMoveSelf(0, +1)
+        return self._canMoveFrom(*custom_pos, 0, +1)
 
     def moveRight(self, board: "Board"):
-        self.__move(board, 0, +1)
+        self._move(board, 0, +1)
 
     def canMoveUp(self, custom_pos: Optional[Tuple[int, int]] = None) -> bool:
-        return self.__canMove(-1, 0, custom_pos)
+        if custom_pos is None:
+            return self._canMoveSelf(-1, 0)
+        return self._canMoveFrom(*custom_pos, -1, 0)
 
     def moveUp(self, board: "Board"):
-        self.__move(board, -1, 0)  # Curses uses quadrant IV instead of the usual I
+        self._move(board, -1, 0)  # Curses uses quadrant IV instead of the usual I
 
     def canMoveDown(self, custom_pos: Optional[Tuple[int, int]] = None) -> bool:
-        return self.__canMove(+1, 0, custom_pos)
+        if custom_pos is None:
+            return self._canMoveSelf(+1, 0)
+        return self._canMoveFrom(*custom_pos, +1, 0)
 
     def moveDown(self, board: "Board"):
-        self.__move(board, +1, 0)
+        self._move(board, +1, 0)
 
-    def __canMove(self, dy: int, dx: int, custom_pos: Optional[Tuple[int, int]] = None):
-        if custom_pos:
-            old_y, old_x = custom_pos
-        else:
-            old_y, old_x = self.position
-        new_y, new_x = (old_y + dy, old_x + dx)
-        return not self.__isOutOfBounds(new_y, new_x)
+    # Both are _isOutOfBounds() inlined and negated, saving a method call per check
+
+    def _canMoveFrom(
+        self, y: int, x: int, dy: int, dx: int, _W: int = _BW1, _H: int = _BH1
+    ) -> bool:
+        y += dy
+        x += dx
+        return (x | y | (_W - x) | (_H - y)) >= 0
 
-    def __move(self, board: "Board", dy: int, dx: int):
-        old_y, old_x = self.position
-        new_y, new_x = (old_y + dy, old_x + dx)
+    def _canMoveSelf(self, dy: int, dx: int, _W: int = _BW1, _H: int = _BH1) -> bool:
+        y = self.pos_y + dy
+        x = self.pos_x + dx
+        return (x | y | (_W - x) | (_H - y)) >= 0
 
-        if self.__isOutOfBounds(new_y, new_x) and not self.__isProjectile():
+    def _move(self, board: "Board", dy: int, dx: int):
+        old_y = self.pos_y
+        old_x = self.pos_x
+        new_y = old_y + dy
+        new_x = old_x + dx
+
+        if self._isOutOfBounds(new_y, new_x) and not self._is_projectile:
             raise Exception("Entity is being moved out of bounds!")
 
-        self.__log(f"Moved from old pos {old_y},{old_x} to new pos {new_y},{new_x}")
+        if Logger.debug_enabled:
+            self._log(
+                "Moved from old pos %s,%s to new pos %s,%s", old_y, old_x, new_y, new_x
+            )
 
+        # Nothing to clear at the old pos, next_board starts empty every tick.
+        # setEntityAtPos() also updates pos_y/pos_x.
         board.setEntityAtPos(new_y, new_x, self)
 
-        self.position = (new_y, new_x)
-
     def stayStill(self, board: "Board"):
-        y, x = self.position
-        board.setEntityAtPos(y, x, self)
-
-    def __isProjectile(self) -> bool:
-        return self.entity_type in (
-            EntityType.PLAYER_PROJECTILE,
-            EntityType.ENEMY_PROJECTILE,
-        )
+        board.setEntityAtPos(self.pos_y, self.pos_x, self)
 
-    def __printBoard(self, board: "Board") -> None:
-        Logger.info(f"\n{board.drawBoard(return_as_str = True)}")
+    def _printBoard(self, board: "Board") -> None:
+        Logger.info("\n%s", board.drawBoard(return_as_str=True))
@@ -7,6 +7,8 @@ from typing import Dict, List, Tuple
 
 from InputType import InputType
 
+_ERR: int = curses.ERR
+
 
 class InputManager:
     """
@@ -35,20 +37,11 @@ class InputManager:
 
     """
     Do we still need the buffer functionality? Might not need it depending on execution flow in SpaceInvaders.run()
-    """
-    buffer_cleared: Dict[InputType, bool] = {
-        InputType.MOVEMENT: False,
-        InputType.FIRE: False,
-        InputType.QUIT: False,
-        InputType.PAUSE: False,
-    }
 
-    last_pressed: Dict[InputType, int] = {
-        InputType.MOVEMENT: curses.ERR,
-        InputType.FIRE: curses.ERR,
-        InputType.QUIT: curses.ERR,
-        InputType.PAUSE: curses.ERR,
-    }
+    Both are indexed by InputType (an IntEnum) rather than being dicts keyed by it.
+    """
+    buffer_cleared: List[bool]
+    last_pressed: List[int]
 
     groups: Dict[InputType, List[int]] = {
         InputType.MOVEMENT: [curses.KEY_LEFT, ord("a"), curses.KEY_RIGHT, ord("d")],
@@ -57,14 +50,17 @@ class InputManager:
         InputType.PAUSE: [ord("p")],
     }
 
-    reverse_group_lookup: Dict[int, InputType] = {}
+    # Built once at class creation. Only the outermost iterable of a comprehension is
+    # evaluated in class scope, which is all this needs.
+    reverse_group_lookup: Dict[int, InputType] = {
+        key: input_type for input_type, keys in groups.items() for key in keys
+    }
 
     def __init__(self, stdscr: curses.window) -> None:  # type: ignore
         self.stdscr = stdscr
 
-        for input_type, keys in self.groups.items():
-            for key in keys:
-                self.reverse_group_lookup[key] = input_type
+        self.buffer_cleared = [False] * len(InputType)
+        self.last_pressed = [_ERR] * len(InputType)
 
     def shouldQuit(self) -> bool:
         last_pressed_key_for_quit = self.getLastPressedKeyForGroup(
@@ -72,25 +68,41 @@ class InputManager:
         )
         return last_pressed_key_for_quit == ord("q")
 
-    def storeInput(self) -> None:
-        key = self.stdscr.getch()
+    def storeInput(self, wait_ms: int = 0) -> None:
+        """
+        Waits up to `wait_ms` for a key to come in, then drains every other buffered key
+        without waiting. The wait happens inside curses so nothing runs in the meantime.
+        """
+        # Called every loop iteration so bind everything the loop touches to locals
+        stdscr = self.stdscr
+        getch = stdscr.getch
+        lookup = self.reverse_group_lookup
+        last_pressed = self.last_pressed
+        buffer_cleared = self.buffer_cleared
+
+        if wait_ms > 0:
+            stdscr.timeout(wait_ms)
+            key = getch()
+            stdscr.timeout(0)  # Back to non-blocking for the rest of the buffer
+        else:
+            key = getch()
 
         # If curses.ERR, no key was pressed.
-        while key != curses.ERR:
-            if key in self.reverse_group_lookup:
-                # If the key pressed is not a key defined in our InputManager,
-                # ignore and get next buffered key
-                group = self.reverse_group_lookup[key]
-                self.last_pressed[group] = key
-                self.buffer_cleared[group] = False
+        while key != _ERR:
+            # If the key pressed is not a key defined in our InputManager,
+            # ignore and get next buffered key
+            group = lookup.get(key)
+            if group is not None:
+                last_pressed[group] = key
+                buffer_cleared[group] = False
 
-            key = self.stdscr.getch()
+            key = getch()
 
     def getLastPressedKeyForGroup(
         self, input_type: InputType, clear_buffer: bool = True
     ) -> int:
         if self.buffer_cleared[input_type]:
-            return curses.ERR
+            return _ERR
         else:
             key = self.last_pressed[input_type]
 
@@ -3,7 +3,11 @@
 import enum
 
 
-class InputType(enum.Enum):
+class InputType(enum.IntEnum):
+    """
+    IntEnum so members can index InputManager's per-group lists directly.
+    """
+
     MOVEMENT = 0
     FIRE = 1
     QUIT = 2
@@ -8,27 +8,38 @@ from Config import Config
 class Logger:
     logger: logging.Logger
 
+    # Cached at init so hot paths can skip log calls entirely with a plain attribute check
+    debug_enabled: bool = False
+    info_enabled: bool = False
+
     def __init__(self):
         logger = logging.getLogger("SpaceInvaders")
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(Config.LOG_LEVEL)
 
         formatter = logging.Formatter("[%(asctime)s][%(levelname)s] %(message)s")
 
         file_handler = logging.FileHandler(Config.LOG_PATH)
-        file_handler.setLevel(logging.DEBUG)
+        file_handler.setLevel(Config.LOG_LEVEL)
         file_handler.setFormatter(formatter)
 
         logger.addHandler(file_handler)
 
         Logger.logger = logger
+        Logger.debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        Logger.info_enabled = logger.isEnabledFor(logging.INFO)
+
+    """
+    Extra args are %-formatted into msg by logging itself, and only if the record is
+    actually emitted. Prefer them over f-strings on hot paths.
+    """
 
     @staticmethod
-    def info(msg: str):
-        Logger.logger.info(msg)
+    def info(msg: str, *args: object):
+        Logger.logger.info(msg, *args)
 
     @staticmethod
-    def debug(msg: str):
-        Logger.logger.debug(msg)
+    def debug(msg: str, *args: object):
+        Logger.logger.debug(msg, *args)
 
 
 Logger()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+import collections
+
+from typing import Deque
+
+from Entity import Entity
+from Entities import Entities
+from EntityType import EntityType
+
+
+class ProjectilePool:
+    """
+    Free-list of projectile Entities.
+
+    Projectiles are short lived and all look alike, so instead of building a new Entity
+    for every shot, destroyed projectiles are released back here and handed out again
+    by the next acquire(). If the pool runs dry a new projectile is built instead.
+    """
+
+    free: Deque[Entity]
+
+    def __init__(self, size: int) -> None:
+        self.free = collections.deque(
+            Entities.genNewPlayerProjectile() for _ in range(size)
+        )
+
+    def acquire(self, is_player: bool) -> Entity:
+        projectile = self.free.pop() if self.free else Entities.genNewPlayerProjectile()
+
+        projectile.setEntityType(
+            EntityType.PLAYER_PROJECTILE if is_player else EntityType.ENEMY_PROJECTILE
+        )
+        projectile.ticks_since_last_move = 0
+        projectile.ticks_since_last_shot = 0
+        return projectile
+
+    def release(self, projectile: Entity) -> None:
+        self.free.append(projectile)
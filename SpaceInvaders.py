@@ -1,16 +1,10 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import copy
-import enum
 import time
 import curses
-import random
-import logging
-import itertools
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple
+from typing import Callable, List, Dict, Tuple
 
 
 from Logger import Logger
@@ -20,7 +14,6 @@ from WindowConfig import WindowConfig
 from Board import Board
 from Entity import Entity
 from Entities import Entities
-from EntityType import EntityType
 from InputManager import InputManager
 from InputType import InputType
 
@@ -69,6 +62,7 @@ class SpaceInvaders:
     """
 
     stdscr: curses.window  # type: ignore
+    screen: curses.window  # type: ignore # Offscreen pad everything is drawn into. See draw()
 
     score: int = 0
     player: Entity
@@ -76,6 +70,9 @@ class SpaceInvaders:
 
     player_pos: Tuple[int, int]
 
+    # Key -> player action for that key. Each action returns whether the player moved.
+    player_actions: Dict[int, Callable[[], bool]]
+
     is_paused: bool = False
     is_won: bool = False
     is_lost: bool = False
@@ -98,11 +95,25 @@ class SpaceInvaders:
         curses.cbreak()
         curses.curs_set(False)
 
+        # The pad gets an extra column so drawing the bottom right cell of the board
+        # doesn't push the cursor past the end of the pad, which curses errors on.
+        self.screen = curses.newpad(
+            WindowConfig.TRUE_BOARD_HEIGHT, WindowConfig.TRUE_BOARD_WIDTH + 1
+        )
+
         self.inputManager = InputManager(self.stdscr)
 
         self.ensureScreenLargeEnough()
         self.initializeEntities()
 
+        self.player_actions = {
+            curses.KEY_LEFT: self.tryMovePlayerLeft,
+            ord("a"): self.tryMovePlayerLeft,
+            curses.KEY_RIGHT: self.tryMovePlayerRight,
+            ord("d"): self.tryMovePlayerRight,
+            ord(" "): self.playerFire,
+        }
+
         self.board = Board(self.player, self.enemies, Config.ENEMY_COUNT, self)
 
     def __del__(self) -> None:
@@ -131,7 +142,7 @@ class SpaceInvaders:
         TODO: Check for fallback chars - ie cannot display unicode? Maybe hard cuz clientside rendering? Args?
         """
 
-        self.player = Entities.PLAYER
+        self.player = Entities.PLAYER.clone()
         self.enemies = Entities.ENEMIES
 
     #######################
@@ -144,34 +155,57 @@ class SpaceInvaders:
             This is a _naive_ implementation of "ticks" or general time keeping.
 
             There are definitely more robust ways to do this, but this should be sufficient for now.
+
+            Between ticks we block in storeInput() until either a key is pressed or the next
+            tick is due, instead of spinning or sleeping past keypresses.
+
+            Tick times use the monotonic clock so wall clock adjustments can't stall or
+            burst ticks. Each deadline is one tick after the previous deadline rather than
+            after when the tick actually started, so waking up late doesn't add up over time.
+            If we've fallen more than a whole tick behind we start over from now instead of
+            running the missed ticks back to back.
         """
 
-        # ns -> nanoseconds
-        target_tick_dur_ns = 1 * 1000 * 1000 * 1000 / Config.TICKS_PER_SECOND
-        curr_tick_start_ns = time.time_ns()
+        # Everything the loop calls, bound to locals once
+        time_ns = time.monotonic_ns
+        check_if_win = self.checkIfWin
+        store_input = self.inputManager.storeInput
+        should_quit = self.inputManager.shouldQuit
+        update = self.update
+        draw = self.draw
 
-        new_tick_start = (
-            lambda: target_tick_dur_ns < time.time_ns() - curr_tick_start_ns
-        )
+        # ns -> nanoseconds
+        target_tick_dur_ns = 1 * 1000 * 1000 * 1000 // Config.TICKS_PER_SECOND
+        next_tick_start_ns = time_ns() + target_tick_dur_ns
 
         while True:
-            self.checkIfWin()
-            self.inputManager.storeInput()
+            check_if_win()
 
-            if self.inputManager.shouldQuit():
+            # Rounded up to whole ms so we don't wake just short of the tick and spin
+            wait_ns = next_tick_start_ns - time_ns()
+            store_input(-(-wait_ns // (1000 * 1000)) if wait_ns > 0 else 0)
+
+            if should_quit():
                 break
 
-            if new_tick_start():
+            now_ns = time_ns()
+            if now_ns < next_tick_start_ns:
+                continue
+
+            if Logger.info_enabled:
                 Logger.info("=======TICK START=======")
+            if Logger.debug_enabled:
                 for projectile in self.board.getPlayerProjectiles():
-                    Logger.debug(f"PLAYERPROJS: {projectile}")
-                curr_tick_start_ns = time.time_ns()
+                    Logger.debug("PLAYERPROJS: %s", projectile)
+            next_tick_start_ns += target_tick_dur_ns
+            if next_tick_start_ns <= now_ns:
+                next_tick_start_ns = now_ns + target_tick_dur_ns
 
-                self.update()
-                self.draw()
+            update()
+            draw()
 
     def checkIfWin(self):
-        self.is_won = len(self.board.getAliveEnemies()) == 0
+        self.is_won = self.board.getAliveEnemyCount() == 0
 
     def updatePlayer(self, pressed_key: int) -> bool:
         """
@@ -179,54 +213,71 @@ class SpaceInvaders:
         - Bool, true if player moved. False if player has not moved.
           Firing does not count as moving.
         """
-        pos_updated: bool = False
-
-        if pressed_key in (curses.KEY_LEFT, ord("a")) and self.player.canMoveLeft():
-            Logger.debug("Moving ship to the left")
-            self.player.moveLeft(self.board)
-            pos_updated = True
-        elif pressed_key in (curses.KEY_RIGHT, ord("d")) and self.player.canMoveRight():
-            Logger.debug("Moving ship to the right")
-            self.player.moveRight(self.board)
-            pos_updated = True
-        elif pressed_key == ord(" "):
-            Logger.debug("Pew pew")
-            self.player.spawnProjectile(self.board)
-
-        return pos_updated
+        action = self.player_actions.get(pressed_key)
+        return action() if action is not None else False
+
+    def tryMovePlayerLeft(self) -> bool:
+        if not self.player.canMoveLeft():
+            return False
+        Logger.debug("Moving ship to the left")
+        self.player.moveLeft(self.board)
+        return True
+
+    def tryMovePlayerRight(self) -> bool:
+        if not self.player.canMoveRight():
+            return False
+        Logger.debug("Moving ship to the right")
+        self.player.moveRight(self.board)
+        return True
+
+    def playerFire(self) -> bool:
+        Logger.debug("Pew pew")
+        self.player.spawnProjectile(self.board)
+        return False
 
     def updateEnemies(self) -> None:
-        # Traverse the list in reverse order so as to not be affected by .pop's changing length of list
-        for enemy in reversed(self.board.getAliveEnemies()):
-            enemy.moveToNextPos(self.board)
+        # getAliveEnemies() is a snapshot so deleting mid-walk is already safe. Newest first
+        # is kept so which entity ends up as a cell's occupant and which is recorded as the
+        # collision stays the same as it always was.
+        self.board.moveEnemies(reversed(self.board.getAliveEnemies()))
 
     def updateProjectiles(self) -> None:
-        # See updateEnemies() for reversed()
-        for proj in reversed(self.board.getPlayerProjectiles()):
-            proj.moveUp(self.board)
-        for proj in reversed(self.board.getEnemyProjectiles()):
-            proj.moveDown(self.board)
+        # Newest first for the same reason as in updateEnemies()
+        self.board.moveEntities(reversed(self.board.getPlayerProjectiles()), -1, 0)
+        self.board.moveEntities(reversed(self.board.getEnemyProjectiles()), +1, 0)
 
     def togglePause(self) -> None:
         self.is_paused = not self.is_paused
 
     def update(self) -> None:
-        Logger.debug("Input:")
         player_moved: bool = False
 
-        for group in InputType:
-            pressed_key = self.inputManager.getLastPressedKeyForGroup(group)
-            Logger.debug(f"{InputType(group).name}: {pressed_key}")
-
-            if pressed_key == curses.ERR:
-                # No input. Check next group.
-                continue
+        # Unrolled per InputType but kept in the enum's order, so movement/fire are
+        # still handled before a pause pressed in the same tick takes effect.
+        # Reading QUIT only clears its buffer, run() is what acts on it.
+        get_key = self.inputManager.getLastPressedKeyForGroup
+        movement_key = get_key(InputType.MOVEMENT)
+        fire_key = get_key(InputType.FIRE)
+        quit_key = get_key(InputType.QUIT)
+        pause_key = get_key(InputType.PAUSE)
+        if Logger.debug_enabled:
+            Logger.debug(
+                "Input: MOVEMENT: %s FIRE: %s QUIT: %s PAUSE: %s",
+                movement_key,
+                fire_key,
+                quit_key,
+                pause_key,
+            )
 
-            if group == InputType.PAUSE:
-                self.togglePause()
+        # If curses.ERR, no key was pressed for that group.
+        if not self.is_paused:
+            if movement_key != curses.ERR:
+                player_moved |= self.updatePlayer(movement_key)
+            if fire_key != curses.ERR:
+                player_moved |= self.updatePlayer(fire_key)
 
-            if not self.is_paused and group in (InputType.MOVEMENT, InputType.FIRE):
-                player_moved |= self.updatePlayer(pressed_key)
+        if pause_key != curses.ERR:
+            self.togglePause()
 
         if not player_moved:
             self.player.stayStill(self.board)
@@ -245,27 +296,40 @@ class SpaceInvaders:
 
         self.drawText()
 
-        self.stdscr.refresh()
+        # Copy only the changed parts of the pad to curses' virtual screen and then
+        # write everything out to the terminal in one go.
+        self.screen.noutrefresh(
+            0,
+            0,
+            0,
+            0,
+            WindowConfig.TRUE_BOARD_HEIGHT - 1,
+            WindowConfig.TRUE_BOARD_WIDTH - 1,
+        )
+        curses.doupdate()
 
     def drawGameEntities(self) -> None:
-        self.board.drawBoard(stdscr=self.stdscr)
+        self.board.drawBoard(stdscr=self.screen)
 
     def drawPauseScreen(self) -> None:
-        text_y, text_x = WindowConfig.PAUSED_TEXT_DRAW_POS
-        self.stdscr.addstr(text_y, text_x, WindowConfig.PAUSED_TEXT)
+        text_y, text_x = WindowConfig.DRAW_POS.paused
+        self.screen.addstr(text_y, text_x, WindowConfig.PAUSED_TEXT)
+        self.board.invalidateDrawnRows()  # Paused text is drawn over the board
 
     def drawWinScreen(self) -> None:
         for pos, text in WindowConfig.getGameWonData():
             text_y, text_x = pos
-            self.stdscr.addstr(text_y, text_x, text)
+            self.screen.addstr(text_y, text_x, text)
 
     def drawText(self) -> None:
-        title_y, title_x = WindowConfig.WINDOW_TITLE_DRAW_POS
-        self.stdscr.addstr(title_y, title_x, WindowConfig.WINDOW_TITLE)
+        draw_pos = WindowConfig.DRAW_POS
+
+        title_y, title_x = draw_pos.title
+        self.screen.addstr(title_y, title_x, WindowConfig.WINDOW_TITLE)
 
-        score_y, score_x = WindowConfig.SCORE_TEXT_DRAW_POS
+        score_y, score_x = draw_pos.score
         score_text = f"{WindowConfig.SCORE_TEXT}{self.score}"
-        self.stdscr.addstr(score_y, score_x, score_text)
+        self.screen.addstr(score_y, score_x, score_text)
 
         if self.is_won:
             self.drawWinScreen()
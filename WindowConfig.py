@@ -2,11 +2,22 @@
 
 import itertools
 
-from typing import Tuple, List
+from typing import NamedTuple, Tuple, List
 
 from Config import Config
 
 
+class DrawPositions(NamedTuple):
+    """
+    (y, x) drawpos of each piece of text drawn every frame. Grouped so the draw code can
+    fetch them all with one attribute lookup.
+    """
+
+    title: Tuple[int, int]
+    paused: Tuple[int, int]
+    score: Tuple[int, int]
+
+
 class WindowConfig:
     """
     This class houses consts related to "window" sizes - ie cell width/lengths
@@ -44,6 +55,13 @@ class WindowConfig:
         sum(OFFSET_ROWS_TO_DRAW_HORIZONTAL) + 1
     )  # +1 because offset vs array length
 
+    ROWS_TO_DRAW_HORIZONTAL: Tuple[int, ...] = tuple(
+        itertools.accumulate(OFFSET_ROWS_TO_DRAW_HORIZONTAL)
+    )
+    assert (
+        ROWS_TO_DRAW_HORIZONTAL[-1] == TRUE_BOARD_HEIGHT - 1
+    )  # Ensure our offsets and true board height match.
+
     WINDOW_TITLE: str = "Space Invaders!"
     WINDOW_TITLE_DRAW_POS: Tuple[int, int] = (
         BORDER_WIDTH,
@@ -57,16 +75,11 @@ class WindowConfig:
     )
 
     GAME_WON_TEXT: str = "Congratulations\nYou Win!\n\nPRESS Q TO QUIT"
-    GAME_WON_DATA: List[Tuple[Tuple[int, int], str]] = []
+    GAME_WON_DATA: List[Tuple[Tuple[int, int], str]]  # Set by computeGameWonData() at import
 
     @staticmethod
     def getGameWonData() -> List[Tuple[Tuple[int, int], str]]:
         """
-        A method instead of consts because apparently list comprehensions don't have
-        variable access to class vars due to weird "comprehensions in classes" scoping oddities.
-
-        Comprehensions because I ain't calculating that by hand for each line.
-
         Return shape is:
         [
             ((y1, x1), line1),
@@ -76,29 +89,9 @@ class WindowConfig:
         ]
 
         Where coords are drawpos for stdscr.addstr()
-        """
-        if WindowConfig.GAME_WON_DATA != []:
-            return WindowConfig.GAME_WON_DATA
 
-        lines = WindowConfig.GAME_WON_TEXT.split("\n")
-
-        WC = WindowConfig
-        game_won_data: List[Tuple[Tuple[int, int], str]] = [
-            (
-                (
-                    WC.BORDER_WIDTH
-                    + WC.TITLE_BAR_HEIGHT
-                    + (Config.BOARD_HEIGHT // 2)
-                    - len(lines) // 2
-                    + idx,  # The 'y' of the drawpos
-                    WC.TRUE_BOARD_WIDTH // 2 - len(line) // 2,  # The 'x' of the drawpos
-                ),
-                line,  # The text being drawn at drawpos
-            )
-            for idx, line in enumerate(lines)
-        ]
-
-        WindowConfig.GAME_WON_DATA = game_won_data
+        Precomputed once at import, see computeGameWonData() below the class.
+        """
         return WindowConfig.GAME_WON_DATA
 
     SCORE_TEXT: str = "Score: "
@@ -107,18 +100,47 @@ class WindowConfig:
         BORDER_WIDTH + 1,
     )
 
-    @staticmethod
-    def getRowsToDrawHorizontals() -> List[int]:
-        rows = list(itertools.accumulate(WindowConfig.OFFSET_ROWS_TO_DRAW_HORIZONTAL))
-        assert (
-            rows[-1] == WindowConfig.TRUE_BOARD_HEIGHT - 1
-        )  # Ensure our offsets and true board height match.
-        return rows
+    DRAW_POS: DrawPositions = DrawPositions(
+        title=WINDOW_TITLE_DRAW_POS,
+        paused=PAUSED_TEXT_DRAW_POS,
+        score=SCORE_TEXT_DRAW_POS,
+    )
 
     @staticmethod
-    def convertToTrueY(y: int) -> int:
-        return WindowConfig.TITLE_BAR_HEIGHT + WindowConfig.BORDER_WIDTH + y
+    def getRowsToDrawHorizontals() -> Tuple[int, ...]:
+        return WindowConfig.ROWS_TO_DRAW_HORIZONTAL
 
-    @staticmethod
-    def convertToTrueX(x: int) -> int:
-        return WindowConfig.BORDER_WIDTH + x
+
+# Game coords -> true coords offsets, ie true_y = y + TRUE_Y_OFFSET. Module constants so
+# hot paths can add them directly.
+TRUE_Y_OFFSET: int = WindowConfig.TITLE_BAR_HEIGHT + WindowConfig.BORDER_WIDTH
+TRUE_X_OFFSET: int = WindowConfig.BORDER_WIDTH
+
+
+def computeGameWonData() -> List[Tuple[Tuple[int, int], str]]:
+    """
+    Lives outside the class because list comprehensions in a class body don't have
+    variable access to class vars due to weird "comprehensions in classes" scoping oddities.
+
+    Comprehensions because I ain't calculating that by hand for each line.
+    """
+    lines = WindowConfig.GAME_WON_TEXT.split("\n")
+
+    WC = WindowConfig
+    return [
+        (
+            (
+                WC.BORDER_WIDTH
+                + WC.TITLE_BAR_HEIGHT
+                + (Config.BOARD_HEIGHT // 2)
+                - len(lines) // 2
+                + idx,  # The 'y' of the drawpos
+                WC.TRUE_BOARD_WIDTH // 2 - len(line) // 2,  # The 'x' of the drawpos
+            ),
+            line,  # The text being drawn at drawpos
+        )
+        for idx, line in enumerate(lines)
+    ]
+
+
+WindowConfig.GAME_WON_DATA = computeGameWonData()